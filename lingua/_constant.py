@@ -20,7 +20,7 @@ from typing import Dict, FrozenSet
 from .language import Language
 
 JAPANESE_CHARACTER_SET: Pattern = regex.compile(r"^[\p{Hiragana}\p{Katakana}\p{Han}]+$")
-LETTER: Pattern = regex.compile(r"^\p{L}+$")
+LETTER_SEQUENCE: Pattern = regex.compile(r"\p{L}+")
 MULTIPLE_WHITESPACE: Pattern = regex.compile(r"\s+")
 NO_LETTER: Pattern = regex.compile(r"^[^\p{L}]+$")
 NUMBERS: Pattern = regex.compile(r"\p{N}")
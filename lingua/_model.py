@@ -13,17 +13,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import math
 import numpy as np
 import regex
 
 from collections import Counter
 from dataclasses import dataclass
-from fractions import Fraction
 from pathlib import Path
-from typing import Counter as TypedCounter, Dict, List, FrozenSet, Optional
+from typing import (
+    Counter as TypedCounter,
+    Dict,
+    List,
+    FrozenSet,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
 
-from ._constant import LETTER
+from ._constant import LETTER_SEQUENCE
 from .language import Language
 from ._ngram import _get_ngram_name_by_length
 
@@ -32,7 +39,7 @@ from ._ngram import _get_ngram_name_by_length
 class _TrainingDataLanguageModel:
     language: Language
     absolute_frequencies: Optional[Dict[str, int]]
-    relative_frequencies: Optional[Dict[str, Fraction]]
+    relative_frequencies: Optional[Dict[str, Tuple[int, int]]]
 
     @classmethod
     def from_text(
@@ -41,7 +48,7 @@ class _TrainingDataLanguageModel:
         language: Language,
         ngram_length: int,
         char_class: str,
-        lower_ngram_absolute_frequencies: Optional[Dict[str, int]],
+        lower_ngram_absolute_frequencies: Optional[Mapping[str, int]],
     ) -> "_TrainingDataLanguageModel":
         absolute_frequencies = cls.compute_absolute_frequencies(
             text, ngram_length, char_class
@@ -70,14 +77,16 @@ class _TrainingDataLanguageModel:
             return None
 
     def to_numpy_binary_file(self, file_path: Path, ngram_length: int):
-        frequencies = []
-        if self.relative_frequencies is not None:
-            for ngram, fraction in self.relative_frequencies.items():
-                frequency = math.log(fraction.numerator / fraction.denominator)
-                frequencies.append((ngram, frequency))
-
+        relative_frequencies = self.relative_frequencies or {}
         dtype = [("ngram", f"U{ngram_length}"), ("frequency", "f2")]
-        arr = np.array(frequencies, dtype=dtype)
+        arr = np.empty(len(relative_frequencies), dtype=dtype)
+        arr["ngram"] = list(relative_frequencies.keys())
+        arr["frequency"] = np.log(
+            [
+                numerator / denominator
+                for numerator, denominator in relative_frequencies.values()
+            ]
+        )
         arr.sort()
 
         np.savez_compressed(file_path, arr=arr)
@@ -87,13 +96,14 @@ class _TrainingDataLanguageModel:
         cls, text: List[str], ngram_length: int, char_class: str
     ) -> Dict[str, int]:
         absolute_frequencies: TypedCounter[str] = Counter()
-        regexp = regex.compile(r"^[{}]+$".format(char_class))
+        regexp = regex.compile(r"[{}]+".format(char_class))
         for line in text:
-            lowercased_line = line.lower()
-            for i in range(0, len(lowercased_line) - ngram_length + 1):
-                substr = lowercased_line[i : i + ngram_length]
-                if regexp.match(substr) is not None:
-                    absolute_frequencies.update([substr])
+            for match in regexp.finditer(line.lower()):
+                word = match.group()
+                absolute_frequencies.update(
+                    word[i : i + ngram_length]
+                    for i in range(0, len(word) - ngram_length + 1)
+                )
         return absolute_frequencies
 
     @classmethod
@@ -101,20 +111,21 @@ class _TrainingDataLanguageModel:
         cls,
         ngram_length: int,
         absolute_frequencies: Dict[str, int],
-        lower_ngram_absolute_frequencies: Optional[Dict[str, int]],
-    ) -> Dict[str, Fraction]:
+        lower_ngram_absolute_frequencies: Optional[Mapping[str, int]],
+    ) -> Dict[str, Tuple[int, int]]:
         if lower_ngram_absolute_frequencies is None:
             return {}
-        ngram_probabilities = {}
-        total_ngram_frequency = sum(absolute_frequencies.values())
-        for ngram, frequency in absolute_frequencies.items():
-            if ngram_length == 1 or len(lower_ngram_absolute_frequencies) == 0:
-                denominator = total_ngram_frequency
-            else:
-                substr = ngram[: ngram_length - 1]
-                denominator = lower_ngram_absolute_frequencies[substr]
-            ngram_probabilities[ngram] = Fraction(frequency, denominator)
-        return ngram_probabilities
+        if ngram_length == 1 or len(lower_ngram_absolute_frequencies) == 0:
+            total_ngram_frequency = sum(absolute_frequencies.values())
+            return {
+                ngram: (frequency, total_ngram_frequency)
+                for ngram, frequency in absolute_frequencies.items()
+            }
+        prefix_length = ngram_length - 1
+        return {
+            ngram: (frequency, lower_ngram_absolute_frequencies[ngram[:prefix_length]])
+            for ngram, frequency in absolute_frequencies.items()
+        }
 
 
 @dataclass
@@ -125,11 +136,11 @@ class _TestDataLanguageModel:
     def from_text(cls, text: str, ngram_length: int) -> "_TestDataLanguageModel":
         if ngram_length not in range(1, 6):
             raise ValueError(f"ngram length {ngram_length} is not in range 1..6")
-        ngrams = set()
-        text_length = len(text)
-        if text_length >= ngram_length:
-            for i in range(0, text_length - ngram_length + 1):
-                substr = text[i : i + ngram_length]
-                if LETTER.fullmatch(substr) is not None:
-                    ngrams.add(substr)
+        ngrams: Set[str] = set()
+        for match in LETTER_SEQUENCE.finditer(text):
+            word = match.group()
+            ngrams.update(
+                word[i : i + ngram_length]
+                for i in range(0, len(word) - ngram_length + 1)
+            )
         return _TestDataLanguageModel(frozenset(ngrams))
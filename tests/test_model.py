@@ -13,11 +13,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import numpy as np
 import pytest
-
-from fractions import Fraction
-from typing import Dict, FrozenSet
+import sys
+
+from collections import Counter
+from pathlib import Path
+from types import MappingProxyType
+from typing import (
+    Counter as TypedCounter,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
 
 from lingua.language import Language
 from lingua._model import _TrainingDataLanguageModel, _TestDataLanguageModel
@@ -27,892 +39,412 @@ TEXT: str = """These sentences are intended for testing purposes.
     By the way, they consist of 23 words in total."""
 
 
-def map_values_to_fractions(dct: Dict[str, str]) -> Dict[str, Fraction]:
-    ngrams = {}
-    for key, value in dct.items():
-        numerator, denominator = value.split("/")
-        ngrams[key] = Fraction(int(numerator), int(denominator))
-    return ngrams
-
-
-def expected_unigrams() -> FrozenSet[str]:
-    return frozenset(
-        {
-            "a",
-            "b",
-            "c",
-            "d",
-            "e",
-            "f",
-            "g",
-            "h",
-            "i",
-            "l",
-            "m",
-            "n",
-            "o",
-            "p",
-            "r",
-            "s",
-            "t",
-            "u",
-            "w",
-            "y",
-        }
-    )
-
-
-def expected_unigram_absolute_frequencies() -> Dict[str, int]:
-    return {
-        "a": 3,
-        "b": 1,
-        "c": 3,
-        "d": 5,
-        "e": 14,
-        "f": 2,
-        "g": 1,
-        "h": 4,
-        "i": 6,
-        "l": 1,
-        "m": 1,
-        "n": 10,
-        "o": 10,
-        "p": 3,
-        "r": 5,
-        "s": 10,
-        "t": 13,
-        "u": 3,
-        "w": 2,
-        "y": 3,
-    }
+def _fast_ascii_lower(text: str) -> str:
+    if not text.isascii():
+        return text.lower()
+    buffer = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+    is_upper = (buffer >= 0x41) & (buffer <= 0x5A)
+    return np.where(is_upper, buffer + 0x20, buffer).tobytes().decode("ascii")
 
 
-def expected_unigram_relative_frequencies() -> Dict[str, Fraction]:
-    return map_values_to_fractions(
-        {
-            "a": "3/100",
-            "b": "1/100",
-            "c": "3/100",
-            "d": "1/20",
-            "e": "7/50",
-            "f": "1/50",
-            "g": "1/100",
-            "h": "1/25",
-            "i": "3/50",
-            "l": "1/100",
-            "m": "1/100",
-            "n": "1/10",
-            "o": "1/10",
-            "p": "3/100",
-            "r": "1/20",
-            "s": "1/10",
-            "t": "13/100",
-            "u": "3/100",
-            "w": "1/50",
-            "y": "3/100",
-        }
-    )
+_TEXT_LOWER: str = _fast_ascii_lower(TEXT)
+_TEXT_LINES: List[str] = TEXT.strip().lower().splitlines()
 
 
-def expected_bigrams() -> FrozenSet[str]:
-    return frozenset(
-        {
-            "de",
-            "pr",
-            "pu",
-            "do",
-            "uc",
-            "ds",
-            "du",
-            "ur",
-            "us",
-            "ed",
-            "in",
-            "io",
-            "em",
-            "en",
-            "is",
-            "al",
-            "es",
-            "ar",
-            "rd",
-            "re",
-            "ey",
-            "nc",
-            "nd",
-            "ay",
-            "ng",
-            "ro",
-            "rp",
-            "no",
-            "ns",
-            "nt",
-            "fo",
-            "wa",
-            "se",
-            "od",
-            "si",
-            "by",
-            "of",
-            "wo",
-            "on",
-            "st",
-            "ce",
-            "or",
-            "os",
-            "ot",
-            "co",
-            "ta",
-            "te",
-            "ct",
-            "th",
-            "ti",
-            "to",
-            "he",
-            "po",
-        }
-    )
+def _compute_expected(lines: List[str], max_n: int = 5) -> Dict[int, Dict[str, int]]:
+    counters: List[TypedCounter[str]] = [Counter() for _ in range(max_n + 1)]
+    for line in lines:
+        words = "".join(char if char.isalpha() else " " for char in line).split()
+        for word in words:
+            for n in range(1, max_n + 1):
+                counters[n].update(word[i : i + n] for i in range(len(word) - n + 1))
+    return {n: dict(counters[n]) for n in range(1, max_n + 1)}
 
 
-def expected_unigram_json_relative_frequencies() -> Dict[str, float]:
+def _parse_ratios(dct: Dict[str, List[int]]) -> Dict[str, Tuple[int, int]]:
     return {
-        ngram: frac.numerator / frac.denominator
-        for ngram, frac in expected_unigram_relative_frequencies().items()
+        key: (numerator, denominator)
+        for key, (numerator, denominator) in dct.items()
     }
 
 
-def expected_bigram_absolute_frequencies() -> Dict[str, int]:
-    return {
-        "de": 1,
-        "pr": 1,
-        "pu": 1,
-        "do": 1,
-        "uc": 1,
-        "ds": 1,
-        "du": 1,
-        "ur": 1,
-        "us": 1,
-        "ed": 1,
-        "in": 4,
-        "io": 1,
-        "em": 1,
-        "en": 3,
-        "is": 1,
-        "al": 1,
-        "es": 4,
-        "ar": 1,
-        "rd": 1,
-        "re": 1,
-        "ey": 1,
-        "nc": 1,
-        "nd": 1,
-        "ay": 1,
-        "ng": 1,
-        "ro": 1,
-        "rp": 1,
-        "no": 1,
-        "ns": 1,
-        "nt": 2,
-        "fo": 1,
-        "wa": 1,
-        "se": 4,
-        "od": 1,
-        "si": 1,
-        "of": 1,
-        "by": 1,
-        "wo": 1,
-        "on": 2,
-        "st": 2,
-        "ce": 1,
-        "or": 2,
-        "os": 1,
-        "ot": 2,
-        "co": 1,
-        "ta": 1,
-        "ct": 1,
-        "te": 3,
-        "th": 4,
-        "ti": 2,
-        "to": 1,
-        "he": 4,
-        "po": 1,
-    }
+_FIXTURES_FILE_PATH: Path = Path(__file__).parent / "fixtures" / "expected_ngrams.json"
 
+with _FIXTURES_FILE_PATH.open(encoding="utf-8") as _fixtures_file:
+    _FIXTURES = json.load(_fixtures_file)
 
-def expected_bigram_relative_frequencies() -> Dict[str, Fraction]:
-    return map_values_to_fractions(
-        {
-            "de": "1/5",
-            "pr": "1/3",
-            "pu": "1/3",
-            "do": "1/5",
-            "uc": "1/3",
-            "ds": "1/5",
-            "du": "1/5",
-            "ur": "1/3",
-            "us": "1/3",
-            "ed": "1/14",
-            "in": "2/3",
-            "io": "1/6",
-            "em": "1/14",
-            "en": "3/14",
-            "is": "1/6",
-            "al": "1/3",
-            "es": "2/7",
-            "ar": "1/3",
-            "rd": "1/5",
-            "re": "1/5",
-            "ey": "1/14",
-            "nc": "1/10",
-            "nd": "1/10",
-            "ay": "1/3",
-            "ng": "1/10",
-            "ro": "1/5",
-            "rp": "1/5",
-            "no": "1/10",
-            "ns": "1/10",
-            "nt": "1/5",
-            "fo": "1/2",
-            "wa": "1/2",
-            "se": "2/5",
-            "od": "1/10",
-            "si": "1/10",
-            "of": "1/10",
-            "by": "1/1",
-            "wo": "1/2",
-            "on": "1/5",
-            "st": "1/5",
-            "ce": "1/3",
-            "or": "1/5",
-            "os": "1/10",
-            "ot": "1/5",
-            "co": "1/3",
-            "ta": "1/13",
-            "ct": "1/3",
-            "te": "3/13",
-            "th": "4/13",
-            "ti": "2/13",
-            "to": "1/13",
-            "he": "1/1",
-            "po": "1/3",
-        }
-    )
+_EXPECTED_ABSOLUTE_FREQUENCIES: Dict[int, Mapping[str, int]] = {
+    int(ngram_length): MappingProxyType(frequencies)
+    for ngram_length, frequencies in _FIXTURES["absolute_frequencies"].items()
+}
 
+_EXPECTED_RATIOS: Dict[int, Dict[str, Tuple[int, int]]] = {
+    int(ngram_length): _parse_ratios(ratios)
+    for ngram_length, ratios in _FIXTURES["relative_frequencies"].items()
+}
 
-def expected_trigrams() -> FrozenSet[str]:
-    return frozenset(
-        {
-            "rds",
-            "ose",
-            "ded",
-            "con",
-            "use",
-            "est",
-            "ion",
-            "ist",
-            "pur",
-            "hem",
-            "hes",
-            "tin",
-            "cti",
-            "tio",
-            "wor",
-            "ten",
-            "hey",
-            "ota",
-            "tal",
-            "tes",
-            "uct",
-            "sti",
-            "pro",
-            "odu",
-            "nsi",
-            "rod",
-            "for",
-            "ces",
-            "nce",
-            "not",
-            "are",
-            "pos",
-            "tot",
-            "end",
-            "enc",
-            "sis",
-            "sen",
-            "nte",
-            "ses",
-            "ord",
-            "ing",
-            "ent",
-            "int",
-            "nde",
-            "way",
-            "the",
-            "rpo",
-            "urp",
-            "duc",
-            "ons",
-            "ese",
-        }
-    )
+_EXPECTED_NGRAM_SETS: Dict[int, FrozenSet[str]] = {
+    int(ngram_length): frozenset(sys.intern(ngram) for ngram in ngrams)
+    for ngram_length, ngrams in _FIXTURES["ngrams"].items()
+}
 
 
-def expected_trigram_absolute_frequencies() -> Dict[str, int]:
-    return {
-        "rds": 1,
-        "ose": 1,
-        "ded": 1,
-        "con": 1,
-        "use": 1,
-        "est": 1,
-        "ion": 1,
-        "ist": 1,
-        "pur": 1,
-        "hem": 1,
-        "hes": 1,
-        "tin": 1,
-        "cti": 1,
-        "wor": 1,
-        "tio": 1,
-        "ten": 2,
-        "ota": 1,
-        "hey": 1,
-        "tal": 1,
-        "tes": 1,
-        "uct": 1,
-        "sti": 1,
-        "pro": 1,
-        "odu": 1,
-        "nsi": 1,
-        "rod": 1,
-        "for": 1,
-        "ces": 1,
-        "nce": 1,
-        "not": 1,
-        "pos": 1,
-        "are": 1,
-        "tot": 1,
-        "end": 1,
-        "enc": 1,
-        "sis": 1,
-        "sen": 1,
-        "nte": 2,
-        "ord": 1,
-        "ses": 1,
-        "ing": 1,
-        "ent": 1,
-        "way": 1,
-        "nde": 1,
-        "int": 1,
-        "rpo": 1,
-        "the": 4,
-        "urp": 1,
-        "duc": 1,
-        "ons": 1,
-        "ese": 1,
-    }
+def ratios_equal(
+    first: Mapping[str, Tuple[int, int]], second: Mapping[str, Tuple[int, int]]
+) -> bool:
+    return first.keys() == second.keys() and all(
+        first[key][0] * second[key][1] == first[key][1] * second[key][0]
+        for key in first
+    )
 
 
-def expected_trigram_relative_frequencies() -> Dict[str, Fraction]:
-    return map_values_to_fractions(
-        {
-            "rds": "1/1",
-            "ose": "1/1",
-            "ded": "1/1",
-            "con": "1/1",
-            "use": "1/1",
-            "est": "1/4",
-            "ion": "1/1",
-            "ist": "1/1",
-            "pur": "1/1",
-            "hem": "1/4",
-            "hes": "1/4",
-            "tin": "1/2",
-            "cti": "1/1",
-            "wor": "1/1",
-            "tio": "1/2",
-            "ten": "2/3",
-            "ota": "1/2",
-            "hey": "1/4",
-            "tal": "1/1",
-            "tes": "1/3",
-            "uct": "1/1",
-            "sti": "1/2",
-            "pro": "1/1",
-            "odu": "1/1",
-            "nsi": "1/1",
-            "rod": "1/1",
-            "for": "1/1",
-            "ces": "1/1",
-            "nce": "1/1",
-            "not": "1/1",
-            "pos": "1/1",
-            "are": "1/1",
-            "tot": "1/1",
-            "end": "1/3",
-            "enc": "1/3",
-            "sis": "1/1",
-            "sen": "1/4",
-            "nte": "1/1",
-            "ord": "1/2",
-            "ses": "1/4",
-            "ing": "1/4",
-            "ent": "1/3",
-            "way": "1/1",
-            "nde": "1/1",
-            "int": "1/4",
-            "rpo": "1/1",
-            "the": "1/1",
-            "urp": "1/1",
-            "duc": "1/1",
-            "ons": "1/2",
-            "ese": "1/4",
-        }
-    )
+_EXPECTED_NGRAMS: np.ndarray = np.array(
+    [
+        "a",
+        "b",
+        "c",
+        "d",
+        "e",
+        "f",
+        "g",
+        "h",
+        "i",
+        "j",
+        "k",
+        "l",
+        "m",
+        "n",
+        "o",
+        "p",
+        "q",
+        "r",
+        "s",
+        "t",
+        "u",
+        "v",
+        "w",
+        "x",
+        "y",
+        "z",
+        "º",
+        "ß",
+        "à",
+        "á",
+        "â",
+        "ã",
+        "ä",
+        "å",
+        "æ",
+        "ç",
+        "è",
+        "é",
+        "ê",
+        "ë",
+        "ì",
+        "í",
+        "î",
+        "ï",
+        "ð",
+        "ñ",
+        "ò",
+        "ó",
+        "ô",
+        "õ",
+        "ö",
+        "ø",
+        "ù",
+        "ú",
+        "û",
+        "ü",
+        "ý",
+        "ÿ",
+        "ā",
+        "ă",
+        "ą",
+        "ć",
+        "ċ",
+        "č",
+        "đ",
+        "ē",
+        "ė",
+        "ę",
+        "ě",
+        "ğ",
+        "ġ",
+        "ħ",
+        "ĩ",
+        "ī",
+        "ı",
+        "ł",
+        "ń",
+        "ņ",
+        "ň",
+        "ō",
+        "œ",
+        "ř",
+        "ś",
+        "ş",
+        "š",
+        "ţ",
+        "ũ",
+        "ū",
+        "ů",
+        "ű",
+        "ź",
+        "ż",
+        "ž",
+        "ƅ",
+        "ơ",
+        "ư",
+        "ƴ",
+        "ș",
+        "ț",
+        "ȼ",
+        "ɑ",
+        "ɔ",
+        "ə",
+        "ɛ",
+        "ɦ",
+        "ʔ",
+        "ḵ",
+        "ạ",
+        "ả",
+        "ặ",
+        "ế",
+        "ệ",
+        "ỉ",
+        "ị",
+        "ộ",
+        "ờ",
+        "ủ",
+        "ứ",
+        "ﬀ",
+        "ﬁ",
+        "ｍ",
+    ],
+    dtype="U1",
+)
 
+_EXPECTED_FREQUENCIES: np.ndarray = np.array(
+    [
+        -2.47,
+        -4.16,
+        -3.44,
+        -3.252,
+        -2.113,
+        -3.842,
+        -3.865,
+        -3.045,
+        -2.623,
+        -6.113,
+        -4.812,
+        -3.17,
+        -3.682,
+        -2.637,
+        -2.574,
+        -3.85,
+        -7.03,
+        -2.758,
+        -2.709,
+        -2.408,
+        -3.6,
+        -4.516,
+        -3.979,
+        -6.297,
+        -4.02,
+        -6.81,
+        -14.74,
+        -15.79,
+        -14.02,
+        -12.06,
+        -11.54,
+        -15.02,
+        -13.586,
+        -14.62,
+        -16.56,
+        -13.516,
+        -13.445,
+        -10.63,
+        -14.55,
+        -14.74,
+        -15.95,
+        -12.3,
+        -15.414,
+        -14.01,
+        -15.31,
+        -12.19,
+        -14.484,
+        -12.164,
+        -14.41,
+        -13.82,
+        -13.055,
+        -14.89,
+        -17.66,
+        -13.4,
+        -15.72,
+        -13.35,
+        -15.22,
+        -16.97,
+        -14.77,
+        -16.4,
+        -16.75,
+        -15.09,
+        -17.66,
+        -14.46,
+        -16.28,
+        -18.36,
+        -17.66,
+        -16.16,
+        -16.28,
+        -14.664,
+        -18.36,
+        -16.75,
+        -17.66,
+        -15.79,
+        -14.92,
+        -14.69,
+        -15.13,
+        -18.36,
+        -17.25,
+        -16.05,
+        -14.26,
+        -15.95,
+        -16.75,
+        -15.46,
+        -14.41,
+        -17.66,
+        -17.66,
+        -15.72,
+        -17.25,
+        -18.36,
+        -16.28,
+        -16.16,
+        -15.36,
+        -18.36,
+        -17.66,
+        -17.25,
+        -18.36,
+        -16.97,
+        -18.36,
+        -17.66,
+        -18.36,
+        -17.66,
+        -18.36,
+        -18.36,
+        -18.36,
+        -17.66,
+        -18.36,
+        -18.36,
+        -17.66,
+        -18.36,
+        -18.36,
+        -16.4,
+        -18.36,
+        -17.25,
+        -17.66,
+        -18.36,
+        -18.36,
+        -18.36,
+        -17.66,
+        -15.586,
+        -17.25,
+    ],
+    dtype="f2",
+)
 
-def expected_quadrigrams() -> FrozenSet[str]:
-    return frozenset(
-        {
-            "onsi",
-            "sist",
-            "ende",
-            "ords",
-            "esti",
-            "tenc",
-            "nces",
-            "oduc",
-            "tend",
-            "thes",
-            "rpos",
-            "ting",
-            "nten",
-            "nsis",
-            "they",
-            "tota",
-            "cons",
-            "tion",
-            "prod",
-            "ence",
-            "test",
-            "otal",
-            "pose",
-            "nded",
-            "oses",
-            "inte",
-            "urpo",
-            "them",
-            "sent",
-            "duct",
-            "stin",
-            "ente",
-            "ucti",
-            "purp",
-            "ctio",
-            "rodu",
-            "word",
-            "hese",
-        }
-    )
+_EXPECTED_NUMPY_ARRAY: np.ndarray = np.empty(
+    len(_EXPECTED_NGRAMS), dtype=[("ngram", "U1"), ("frequency", "f2")]
+)
+_EXPECTED_NUMPY_ARRAY["ngram"] = _EXPECTED_NGRAMS
+_EXPECTED_NUMPY_ARRAY["frequency"] = _EXPECTED_FREQUENCIES
 
 
-def expected_quadrigram_absolute_frequencies() -> Dict[str, int]:
-    return {
-        "onsi": 1,
-        "sist": 1,
-        "ende": 1,
-        "ords": 1,
-        "esti": 1,
-        "oduc": 1,
-        "nces": 1,
-        "tenc": 1,
-        "tend": 1,
-        "thes": 1,
-        "rpos": 1,
-        "ting": 1,
-        "nsis": 1,
-        "nten": 2,
-        "tota": 1,
-        "they": 1,
-        "cons": 1,
-        "tion": 1,
-        "prod": 1,
-        "otal": 1,
-        "test": 1,
-        "ence": 1,
-        "pose": 1,
-        "oses": 1,
-        "nded": 1,
-        "inte": 1,
-        "them": 1,
-        "urpo": 1,
-        "duct": 1,
-        "sent": 1,
-        "stin": 1,
-        "ucti": 1,
-        "ente": 1,
-        "purp": 1,
-        "ctio": 1,
-        "rodu": 1,
-        "word": 1,
-        "hese": 1,
-    }
+@pytest.fixture
+def expected_numpy_array() -> np.ndarray:
+    return _EXPECTED_NUMPY_ARRAY
 
 
-def expected_quadrigram_relative_frequencies() -> Dict[str, Fraction]:
-    return map_values_to_fractions(
-        {
-            "onsi": "1/1",
-            "sist": "1/1",
-            "ende": "1/1",
-            "ords": "1/1",
-            "esti": "1/1",
-            "oduc": "1/1",
-            "nces": "1/1",
-            "tenc": "1/2",
-            "tend": "1/2",
-            "thes": "1/4",
-            "rpos": "1/1",
-            "ting": "1/1",
-            "nsis": "1/1",
-            "nten": "1/1",
-            "tota": "1/1",
-            "they": "1/4",
-            "cons": "1/1",
-            "tion": "1/1",
-            "prod": "1/1",
-            "otal": "1/1",
-            "test": "1/1",
-            "ence": "1/1",
-            "pose": "1/1",
-            "oses": "1/1",
-            "nded": "1/1",
-            "inte": "1/1",
-            "them": "1/4",
-            "urpo": "1/1",
-            "duct": "1/1",
-            "sent": "1/1",
-            "stin": "1/1",
-            "ucti": "1/1",
-            "ente": "1/1",
-            "purp": "1/1",
-            "ctio": "1/1",
-            "rodu": "1/1",
-            "word": "1/1",
-            "hese": "1/1",
-        }
-    )
+@pytest.fixture(scope="session")
+def english_unigram_model() -> Optional[np.ndarray]:
+    return _TrainingDataLanguageModel.from_numpy_binary_file(Language.ENGLISH, 1)
 
 
-def expected_fivegrams() -> FrozenSet[str]:
-    return frozenset(
-        {
-            "testi",
-            "sente",
-            "ences",
-            "tende",
-            "these",
-            "ntenc",
-            "ducti",
-            "ntend",
-            "onsis",
-            "total",
-            "uctio",
-            "enten",
-            "poses",
-            "ction",
-            "produ",
-            "inten",
-            "nsist",
-            "words",
-            "sting",
-            "tence",
-            "purpo",
-            "estin",
-            "roduc",
-            "urpos",
-            "ended",
-            "rpose",
-            "oduct",
-            "consi",
-        }
+def test_training_data_model_retrieval(english_unigram_model, expected_numpy_array):
+    arr = english_unigram_model
+    assert arr is not None
+    assert np.array_equal(arr["ngram"], expected_numpy_array["ngram"])
+    assert np.array_equal(
+        arr["frequency"].view(np.uint16),
+        expected_numpy_array["frequency"].view(np.uint16),
     )
 
 
-def expected_fivegram_absolute_frequencies() -> Dict[str, int]:
+@pytest.fixture(scope="session")
+def training_data_models() -> Dict[int, _TrainingDataLanguageModel]:
     return {
-        "testi": 1,
-        "sente": 1,
-        "ences": 1,
-        "tende": 1,
-        "ducti": 1,
-        "ntenc": 1,
-        "these": 1,
-        "onsis": 1,
-        "ntend": 1,
-        "total": 1,
-        "uctio": 1,
-        "enten": 1,
-        "poses": 1,
-        "ction": 1,
-        "produ": 1,
-        "inten": 1,
-        "nsist": 1,
-        "words": 1,
-        "sting": 1,
-        "purpo": 1,
-        "tence": 1,
-        "estin": 1,
-        "roduc": 1,
-        "urpos": 1,
-        "rpose": 1,
-        "ended": 1,
-        "oduct": 1,
-        "consi": 1,
+        ngram_length: _TrainingDataLanguageModel.from_text(
+            _TEXT_LINES,
+            Language.ENGLISH,
+            ngram_length,
+            "\\p{L}&&\\p{Latin}",
+            _EXPECTED_ABSOLUTE_FREQUENCIES.get(ngram_length - 1, {}),
+        )
+        for ngram_length in range(1, 6)
     }
 
 
-def expected_fivegram_relative_frequencies() -> Dict[str, Fraction]:
-    return map_values_to_fractions(
-        {
-            "testi": "1/1",
-            "sente": "1/1",
-            "ences": "1/1",
-            "tende": "1/1",
-            "ducti": "1/1",
-            "ntenc": "1/2",
-            "these": "1/1",
-            "onsis": "1/1",
-            "ntend": "1/2",
-            "total": "1/1",
-            "uctio": "1/1",
-            "enten": "1/1",
-            "poses": "1/1",
-            "ction": "1/1",
-            "produ": "1/1",
-            "inten": "1/1",
-            "nsist": "1/1",
-            "words": "1/1",
-            "sting": "1/1",
-            "purpo": "1/1",
-            "tence": "1/1",
-            "estin": "1/1",
-            "roduc": "1/1",
-            "urpos": "1/1",
-            "rpose": "1/1",
-            "ended": "1/1",
-            "oduct": "1/1",
-            "consi": "1/1",
-        }
-    )
+@pytest.mark.parametrize(
+    "ngram_length",
+    [
+        pytest.param(1, id="unigram_model"),
+        pytest.param(2, id="bigram_model"),
+        pytest.param(3, id="trigram_model"),
+        pytest.param(4, id="quadrigram_model"),
+        pytest.param(5, id="fivegram_model"),
+    ],
+)
+def test_training_data_model_creation(training_data_models, ngram_length):
+    expected_absolute_frequencies = _EXPECTED_ABSOLUTE_FREQUENCIES[ngram_length]
+    expected_relative_frequencies = _EXPECTED_RATIOS[ngram_length]
+    model = training_data_models[ngram_length]
+    assert model.language == Language.ENGLISH
+    assert model.absolute_frequencies == expected_absolute_frequencies
+    assert model.relative_frequencies is not None
+    assert ratios_equal(model.relative_frequencies, expected_relative_frequencies)
 
 
-@pytest.fixture
-def expected_numpy_array() -> np.ndarray:
-    return np.array(
-        [
-            ("a", -2.47),
-            ("b", -4.16),
-            ("c", -3.44),
-            ("d", -3.252),
-            ("e", -2.113),
-            ("f", -3.842),
-            ("g", -3.865),
-            ("h", -3.045),
-            ("i", -2.623),
-            ("j", -6.113),
-            ("k", -4.812),
-            ("l", -3.17),
-            ("m", -3.682),
-            ("n", -2.637),
-            ("o", -2.574),
-            ("p", -3.85),
-            ("q", -7.03),
-            ("r", -2.758),
-            ("s", -2.709),
-            ("t", -2.408),
-            ("u", -3.6),
-            ("v", -4.516),
-            ("w", -3.979),
-            ("x", -6.297),
-            ("y", -4.02),
-            ("z", -6.81),
-            ("º", -14.74),
-            ("ß", -15.79),
-            ("à", -14.02),
-            ("á", -12.06),
-            ("â", -11.54),
-            ("ã", -15.02),
-            ("ä", -13.586),
-            ("å", -14.62),
-            ("æ", -16.56),
-            ("ç", -13.516),
-            ("è", -13.445),
-            ("é", -10.63),
-            ("ê", -14.55),
-            ("ë", -14.74),
-            ("ì", -15.95),
-            ("í", -12.3),
-            ("î", -15.414),
-            ("ï", -14.01),
-            ("ð", -15.31),
-            ("ñ", -12.19),
-            ("ò", -14.484),
-            ("ó", -12.164),
-            ("ô", -14.41),
-            ("õ", -13.82),
-            ("ö", -13.055),
-            ("ø", -14.89),
-            ("ù", -17.66),
-            ("ú", -13.4),
-            ("û", -15.72),
-            ("ü", -13.35),
-            ("ý", -15.22),
-            ("ÿ", -16.97),
-            ("ā", -14.77),
-            ("ă", -16.4),
-            ("ą", -16.75),
-            ("ć", -15.09),
-            ("ċ", -17.66),
-            ("č", -14.46),
-            ("đ", -16.28),
-            ("ē", -18.36),
-            ("ė", -17.66),
-            ("ę", -16.16),
-            ("ě", -16.28),
-            ("ğ", -14.664),
-            ("ġ", -18.36),
-            ("ħ", -16.75),
-            ("ĩ", -17.66),
-            ("ī", -15.79),
-            ("ı", -14.92),
-            ("ł", -14.69),
-            ("ń", -15.13),
-            ("ņ", -18.36),
-            ("ň", -17.25),
-            ("ō", -16.05),
-            ("œ", -14.26),
-            ("ř", -15.95),
-            ("ś", -16.75),
-            ("ş", -15.46),
-            ("š", -14.41),
-            ("ţ", -17.66),
-            ("ũ", -17.66),
-            ("ū", -15.72),
-            ("ů", -17.25),
-            ("ű", -18.36),
-            ("ź", -16.28),
-            ("ż", -16.16),
-            ("ž", -15.36),
-            ("ƅ", -18.36),
-            ("ơ", -17.66),
-            ("ư", -17.25),
-            ("ƴ", -18.36),
-            ("ș", -16.97),
-            ("ț", -18.36),
-            ("ȼ", -17.66),
-            ("ɑ", -18.36),
-            ("ɔ", -17.66),
-            ("ə", -18.36),
-            ("ɛ", -18.36),
-            ("ɦ", -18.36),
-            ("ʔ", -17.66),
-            ("ḵ", -18.36),
-            ("ạ", -18.36),
-            ("ả", -17.66),
-            ("ặ", -18.36),
-            ("ế", -18.36),
-            ("ệ", -16.4),
-            ("ỉ", -18.36),
-            ("ị", -17.25),
-            ("ộ", -17.66),
-            ("ờ", -18.36),
-            ("ủ", -18.36),
-            ("ứ", -18.36),
-            ("ﬀ", -17.66),
-            ("ﬁ", -15.586),
-            ("ｍ", -17.25),
-        ],
-        dtype=[("ngram", "U1"), ("frequency", "f2")],
-    )
+def test_expected_absolute_frequencies_match_text():
+    assert _compute_expected(_TEXT_LINES) == _EXPECTED_ABSOLUTE_FREQUENCIES
 
 
-def test_training_data_model_retrieval(expected_numpy_array):
-    arr = _TrainingDataLanguageModel.from_numpy_binary_file(Language.ENGLISH, 1)
-    assert np.array_equal(arr, expected_numpy_array)
+def test_training_data_model_ignores_line_breaks():
+    model = _TrainingDataLanguageModel.from_text(
+        ["Word\n", "wo\n"], Language.ENGLISH, 2, "\\p{L}&&\\p{Latin}", {}
+    )
+    assert model.absolute_frequencies == {"wo": 2, "or": 1, "rd": 1}
 
 
 @pytest.mark.parametrize(
-    "ngram_length,"
-    "expected_absolute_frequencies,"
-    "expected_relative_frequencies,"
-    "lower_ngram_absolute_frequencies",
+    "ngram_length",
     [
-        pytest.param(
-            1,
-            expected_unigram_absolute_frequencies(),
-            expected_unigram_relative_frequencies(),
-            {},
-            id="unigram_model",
-        ),
-        pytest.param(
-            2,
-            expected_bigram_absolute_frequencies(),
-            expected_bigram_relative_frequencies(),
-            expected_unigram_absolute_frequencies(),
-            id="bigram_model",
-        ),
-        pytest.param(
-            3,
-            expected_trigram_absolute_frequencies(),
-            expected_trigram_relative_frequencies(),
-            expected_bigram_absolute_frequencies(),
-            id="trigram_model",
-        ),
-        pytest.param(
-            4,
-            expected_quadrigram_absolute_frequencies(),
-            expected_quadrigram_relative_frequencies(),
-            expected_trigram_absolute_frequencies(),
-            id="quadrigram_model",
-        ),
-        pytest.param(
-            5,
-            expected_fivegram_absolute_frequencies(),
-            expected_fivegram_relative_frequencies(),
-            expected_quadrigram_absolute_frequencies(),
-            id="fivegram_model",
-        ),
+        pytest.param(1, id="unigram_model"),
+        pytest.param(2, id="bigram_model"),
+        pytest.param(3, id="trigram_model"),
+        pytest.param(4, id="quadrigram_model"),
+        pytest.param(5, id="fivegram_model"),
     ],
 )
-def test_training_data_model_creation(
-    ngram_length,
-    expected_absolute_frequencies,
-    expected_relative_frequencies,
-    lower_ngram_absolute_frequencies,
-):
-    model = _TrainingDataLanguageModel.from_text(
-        TEXT.strip().lower().splitlines(),
-        Language.ENGLISH,
-        ngram_length,
-        "\\p{L}&&\\p{Latin}",
-        lower_ngram_absolute_frequencies,
-    )
-    assert model.language == Language.ENGLISH
-    assert model.absolute_frequencies == expected_absolute_frequencies
-    assert model.relative_frequencies == expected_relative_frequencies
+def test_test_data_model_creation(ngram_length):
+    model = _TestDataLanguageModel.from_text(_TEXT_LOWER, ngram_length)
+    assert model.ngrams == _EXPECTED_NGRAM_SETS[ngram_length]
 
 
 @pytest.mark.parametrize(
-    "ngram_length,expected_ngrams",
+    "text",
     [
-        pytest.param(1, expected_unigrams(), id="unigram_model"),
-        pytest.param(2, expected_bigrams(), id="bigram_model"),
-        pytest.param(3, expected_trigrams(), id="trigram_model"),
-        pytest.param(4, expected_quadrigrams(), id="quadrigram_model"),
-        pytest.param(5, expected_fivegrams(), id="fivegram_model"),
+        pytest.param("ABC, xyz@[`", id="ascii"),
+        pytest.param("⚠ ÄÖÜ Straße", id="non_ascii"),
     ],
 )
-def test_test_data_model_creation(ngram_length, expected_ngrams):
-    model = _TestDataLanguageModel.from_text(TEXT.lower(), ngram_length)
-    assert model.ngrams == expected_ngrams
+def test_fast_ascii_lower(text):
+    assert _fast_ascii_lower(text) == text.lower()